@@ -1,6 +1,14 @@
 import asyncio
+import collections
 import json
+import mimetypes
 import os
+import stat as stat_module
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fallback to stdlib json below
 import time
 import platform
 import subprocess
@@ -9,8 +17,8 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from worker import ScraperWorker
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
+from worker import ChromeSession, ScraperWorker
 from pyngrok import ngrok
 import uvicorn
 
@@ -20,9 +28,38 @@ import uvicorn
 loop_ref = None
 USE_NGROK = False
 
+# First byte of a binary frame identifies its kind (0x01 = PNG screenshot)
+IMAGE_FRAME_TAG = b"\x01"
+
 # =============================================================================
 # UTILITIES
 # =============================================================================
+def _dumps(message: dict) -> bytes:
+    """Serializes a message to JSON bytes. orjson is ~10x faster than stdlib."""
+    if orjson:
+        return orjson.dumps(message)
+    return json.dumps(message).encode("utf-8")
+
+def _loads(data) -> dict:
+    """Parses a JSON command from str or bytes."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Pre-baked envelope prefixes for the common event types, e.g.
+# b'{"type":"log","payload":' — saves a dict alloc + key hashing per event.
+_FRAME_PREFIX = {
+    et: _dumps({"type": et, "payload": None})[:-5]
+    for et in ("log", "row", "image", "status")
+}
+
+def _frame(event_type: str, payload) -> bytes:
+    """Serializes one typed event, using the pre-baked envelope when possible."""
+    prefix = _FRAME_PREFIX.get(event_type)
+    if prefix is not None:
+        return prefix + _dumps(payload) + b"}"
+    return _dumps({"type": event_type, "payload": payload})
+
 def force_kill_ngrok():
     """Aggressively kills system-wide ngrok processes."""
     system = platform.system()
@@ -32,6 +69,13 @@ def force_kill_ngrok():
     except Exception as e:
         print(f"⚠️ Process cleanup warning: {e}")
 
+def _start_ngrok() -> str:
+    """Blocking: clears stale tunnels and opens a fresh one. Run off-loop."""
+    force_kill_ngrok()
+    ngrok.kill()
+    time.sleep(2)  # Let the killed agent release its port
+    return ngrok.connect("127.0.0.1:8000").public_url
+
 # =============================================================================
 # CONNECTION MANAGER
 # =============================================================================
@@ -42,21 +86,46 @@ class ConnectionManager:
     """
     def __init__(self):
         self.active_connections: dict[WebSocket, ScraperWorker] = {}
+        self._queues: dict[WebSocket, collections.deque] = {}
+        self._events: dict[WebSocket, asyncio.Event] = {}
+        self._drain_tasks: dict[WebSocket, asyncio.Task] = {}
+        # One Chrome per connection, reused across scraper restarts.
+        # Launched lazily on the first start command (headless isn't known
+        # until then), then kept warm until the socket closes.
+        self._chrome_sessions: dict[WebSocket, ChromeSession] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
         self.active_connections[websocket] = None
+        self._chrome_sessions[websocket] = ChromeSession()
+        self._queues[websocket] = collections.deque(maxlen=256)
+        self._events[websocket] = asyncio.Event()
+        self._drain_tasks[websocket] = asyncio.create_task(self._drain_loop(websocket))
 
     def disconnect(self, websocket: WebSocket):
-        worker = self.active_connections.get(websocket)
+        # Single hash probe; disconnect may race a second disconnect call
+        worker = self.active_connections.pop(websocket, None)
         if worker:
             print("🔌 Stopping worker for disconnected user...")
             worker.stop()
-        if websocket in self.active_connections:
-            del self.active_connections[websocket]
+        task = self._drain_tasks.pop(websocket, None)
+        if task:
+            task.cancel()
+        self._queues.pop(websocket, None)
+        self._events.pop(websocket, None)
+        session = self._chrome_sessions.pop(websocket, None)
+        if session:
+            # close() blocks (terminate + wait + profile rmtree); run it
+            # off-loop so other clients don't stall on a disconnect
+            try:
+                asyncio.get_running_loop()
+                asyncio.create_task(asyncio.to_thread(session.close))
+            except RuntimeError:
+                session.close()
 
     def set_worker(self, websocket: WebSocket, worker: ScraperWorker):
-        # Stop existing worker if present
+        # Stop existing worker if present (get + insert is already minimal:
+        # the slot must stay registered for the drain task)
         old_worker = self.active_connections.get(websocket)
         if old_worker:
             old_worker.stop()
@@ -65,47 +134,94 @@ class ConnectionManager:
     def get_worker(self, websocket: WebSocket) -> ScraperWorker:
         return self.active_connections.get(websocket)
 
-    async def send_private_message(self, message: dict, websocket: WebSocket):
-        """Sends data ONLY to the specific user's socket."""
+    async def send_private_event(self, event_type: str, payload, websocket: WebSocket):
+        """Sends one typed event ONLY to the specific user's socket."""
+        try:
+            await websocket.send_bytes(_frame(event_type, payload))
+        except RuntimeError:
+            pass  # Socket closed
+
+    async def send_private_bytes(self, data: bytes, websocket: WebSocket):
+        """Sends a pre-framed binary payload (e.g. tagged screenshot)."""
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_bytes(data)
         except RuntimeError:
             pass  # Socket closed
 
+    def enqueue(self, websocket: WebSocket, event_type: str, payload):
+        """
+        Thread-safe event hand-off from worker threads.
+        Appends to the connection's queue and wakes its drain task with a
+        single call_soon_threadsafe instead of one Future per event.
+        """
+        queue = self._queues.get(websocket)
+        event = self._events.get(websocket)
+        if queue is None or event is None:
+            return
+        if loop_ref and loop_ref.is_running():
+            queue.append((event_type, payload))
+            loop_ref.call_soon_threadsafe(event.set)
+
+    async def _drain_loop(self, websocket: WebSocket):
+        """
+        Single consumer per socket: drains the queue and coalesces a burst
+        of events into one frame. Only the newest screenshot in a batch is
+        kept — stale frames are worthless to the live view.
+        """
+        queue = self._queues[websocket]
+        event = self._events[websocket]
+        try:
+            while True:
+                await event.wait()
+                event.clear()
+                frames = []
+                image = None
+                while queue:
+                    event_type, payload = queue.popleft()
+                    if event_type == "image_bin":
+                        image = payload
+                    else:
+                        frames.append(_frame(event_type, payload))
+                if frames:
+                    await self.send_private_bytes(b"[" + b",".join(frames) + b"]", websocket)
+                if image is not None:
+                    await self.send_private_bytes(IMAGE_FRAME_TAG + image, websocket)
+        except asyncio.CancelledError:
+            pass
+
     async def handle_command(self, websocket: WebSocket, command: dict):
         """Processes incoming JSON commands from the frontend."""
         action = command.get("action")
         
         if action == "start":
-            self._handle_start(websocket, command)
+            await self._handle_start(websocket, command)
         elif action == "stop":
             self._handle_stop(websocket)
 
-    def _handle_start(self, websocket: WebSocket, command: dict):
+    async def _handle_start(self, websocket: WebSocket, command: dict):
         current_worker = self.get_worker(websocket)
         if current_worker and current_worker.is_running:
             current_worker.stop()
-            time.sleep(0.5)
+            # Wait for the old scrape loop to actually exit (bounded)
+            # rather than hoping a fixed grace period is enough
+            await current_worker.wait_stopped(timeout=2.0)
 
         keyword = command.get("keyword", "")
         headless = command.get("headless", False)
         ignore_urls = command.get("ignore_urls", [])
 
         # Notify UI
-        asyncio.create_task(self.send_private_message({"type": "status", "payload": "RUNNING"}, websocket))
+        asyncio.create_task(self.send_private_event("status", "RUNNING", websocket))
         log_msg = f"> Resuming '{keyword}'..." if ignore_urls else f"> Starting '{keyword}'..."
-        asyncio.create_task(self.send_private_message({"type": "log", "payload": log_msg}, websocket))
+        asyncio.create_task(self.send_private_event("log", log_msg, websocket))
 
         # Create Thread-Safe Callback
         def user_callback(event_type, payload):
-            if loop_ref and loop_ref.is_running():
-                asyncio.run_coroutine_threadsafe(
-                    self.send_private_message({"type": event_type, "payload": payload}, websocket), 
-                    loop_ref
-                )
+            self.enqueue(websocket, event_type, payload)
 
         # Init & Start Worker
-        new_worker = ScraperWorker(keyword, headless, user_callback, ignore_urls)
+        new_worker = ScraperWorker(keyword, headless, user_callback, ignore_urls,
+                                   chrome_session=self._chrome_sessions.get(websocket))
         self.set_worker(websocket, new_worker)
         new_worker.start()
 
@@ -113,8 +229,8 @@ class ConnectionManager:
         worker = self.get_worker(websocket)
         if worker:
             worker.stop()
-            asyncio.create_task(self.send_private_message({"type": "status", "payload": "STOPPED"}, websocket))
-            asyncio.create_task(self.send_private_message({"type": "log", "payload": "> Stop requested."}, websocket))
+            asyncio.create_task(self.send_private_event("status", "STOPPED", websocket))
+            asyncio.create_task(self.send_private_event("log", "> Stop requested.", websocket))
 
 manager = ConnectionManager()
 
@@ -131,14 +247,16 @@ async def lifespan(app: FastAPI):
     print(f"🚀 SERVER MODE: {'NGROK (Public)' if USE_NGROK else 'LOCALHOST (Private)'}")
     
     if USE_NGROK:
-        try:
-            force_kill_ngrok()
-            ngrok.kill()
-            time.sleep(2)
-            public_url = ngrok.connect("127.0.0.1:8000").public_url
-            print(f"🌍 PUBLIC URL: {public_url}")
-        except Exception as e:
-            print(f"⚠️ Ngrok Failed: {e}. Falling back to Localhost.")
+        # Tunnel setup blocks for seconds; bring it up concurrently with
+        # the server instead of on the startup critical path.
+        async def _announce_tunnel():
+            try:
+                public_url = await asyncio.to_thread(_start_ngrok)
+                print(f"🌍 PUBLIC URL: {public_url}")
+            except Exception as e:
+                print(f"⚠️ Ngrok Failed: {e}. Falling back to Localhost.")
+        asyncio.create_task(_announce_tunnel())
+        print("⏳ Ngrok tunnel starting in background...")
     else:
         print("🏠 LOCAL URL: http://127.0.0.1:8000")
     print("==================================================================\n")
@@ -149,12 +267,19 @@ async def lifespan(app: FastAPI):
     print("🛑 Shutting down...")
     for ws, worker in manager.active_connections.items():
         if worker: worker.stop()
+    sessions = list(manager._chrome_sessions.values())
+    manager._chrome_sessions.clear()
+    if sessions:
+        # Tear the Chrome processes down concurrently, off-loop
+        await asyncio.gather(*(asyncio.to_thread(s.close) for s in sessions))
     
     if USE_NGROK:
         ngrok.kill()
         force_kill_ngrok()
 
-app = FastAPI(lifespan=lifespan)
+# orjson-backed responses for any JSON endpoint (FileResponse unaffected)
+app = FastAPI(lifespan=lifespan,
+              default_response_class=ORJSONResponse if orjson else JSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -169,8 +294,12 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         while True:
-            data = await websocket.receive_text()
-            command = json.loads(data)
+            # Accept both text and binary command frames
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            data = message["bytes"] if message.get("bytes") is not None else message["text"]
+            command = _loads(data)
             await manager.handle_command(websocket, command)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -181,11 +310,43 @@ async def websocket_endpoint(websocket: WebSocket):
 # =============================================================================
 # STATIC FILES & ENTRY
 # =============================================================================
+class CachedStaticFiles(StaticFiles):
+    """
+    Serves Vite's hash-named assets with immutable cache headers and
+    prefers pre-built .br/.gz variants when the client accepts them
+    (see the compression step in setup.sh).
+    """
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    async def get_response(self, path: str, scope):
+        accept = ""
+        for key, value in scope.get("headers") or []:
+            if key == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            if encoding not in accept:
+                continue
+            full_path, stat_result = self.lookup_path(path + suffix)
+            if stat_result and stat_module.S_ISREG(stat_result.st_mode):
+                media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                response = FileResponse(full_path, stat_result=stat_result, media_type=media_type)
+                response.headers["Content-Encoding"] = encoding
+                response.headers["Vary"] = "Accept-Encoding"
+                response.headers["Cache-Control"] = self.CACHE_CONTROL
+                return response
+
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = self.CACHE_CONTROL
+        return response
+
 frontend_dist = os.path.join(os.path.dirname(__file__), "../frontend/dist")
 
 if os.path.exists(frontend_dist):
     # Mount assets (JS/CSS)
-    app.mount("/assets", StaticFiles(directory=os.path.join(frontend_dist, "assets")), name="assets")
+    app.mount("/assets", CachedStaticFiles(directory=os.path.join(frontend_dist, "assets")), name="assets")
     
     # Serve Index (SPA Entry Point)
     @app.get("/")
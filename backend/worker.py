@@ -1,3 +1,8 @@
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
 import threading
 import time
 import random
@@ -10,72 +15,392 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    import xxhash
+
+    def _hash_url(url: str) -> int:
+        return xxhash.xxh3_64_intdigest(url)
+except ImportError:
+    def _hash_url(url: str) -> int:
+        return hash(url)  # Per-process only, which is all dedup needs
+
+# Pre-compiled patterns for the per-item extraction hot path
+_RE_RATING = re.compile(r'^\d[.,]\d$')
+_RE_ARIA_STARS = re.compile(r'(\d[.,]\d) stars')
+_RE_RATED = re.compile(r'Rated (\d[.,]\d)')
+
+# Launch flags shared by driver-managed and pre-launched Chrome processes
+_CHROME_ARGS = [
+    # Stability arguments for various environments (Docker, Linux, etc.)
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--window-size=1280,800",
+    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    # The scraper only reads text fields: skip map tiles, avatars and
+    # notifications to cut page weight and speed up DOM queries.
+    # Screenshots still capture the rendered (text) page.
+    "--blink-settings=imagesEnabled=false",
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame",
+    "--disable-extensions",
+    "--disable-sync",
+]
+
+class ChromeSession:
+    """
+    A long-lived Chrome process that successive ScraperWorkers attach to
+    via the DevTools debugger address, amortizing the 1-3 s cold start
+    across scraper restarts on the same connection.
+    """
+    def __init__(self):
+        self.process: Optional[subprocess.Popen] = None
+        self.headless: Optional[bool] = None
+        self.debugger_address: Optional[str] = None
+        self._profile_dir: Optional[str] = None
+
+    def ensure(self, headless: bool) -> Optional[str]:
+        """Returns a debugger address, (re)launching Chrome if needed."""
+        if self.process and self.process.poll() is None and self.headless == headless:
+            return self.debugger_address
+        self.close()
+
+        chrome = self._find_chrome()
+        if not chrome:
+            return None  # Caller falls back to a driver-managed Chrome
+
+        self._profile_dir = tempfile.mkdtemp(prefix="gmaps_profile_")
+        args = [chrome,
+                "--remote-debugging-port=0",
+                f"--user-data-dir={self._profile_dir}",
+                "--no-first-run",
+                "--no-default-browser-check"]
+        args += _CHROME_ARGS
+        if headless:
+            args.append("--headless=new")
+        args.append("about:blank")
+
+        try:
+            self.process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError:
+            self.close()
+            return None
+        self.headless = headless
+
+        port = self._wait_for_port()
+        if port is None:
+            self.close()
+            return None
+        self.debugger_address = f"127.0.0.1:{port}"
+        return self.debugger_address
+
+    def _wait_for_port(self, timeout: float = 10.0) -> Optional[int]:
+        """Chrome writes the chosen DevTools port into the profile dir."""
+        marker = os.path.join(self._profile_dir, "DevToolsActivePort")
+        end_time = time.time() + timeout
+        while time.time() < end_time:
+            if self.process.poll() is not None:
+                return None
+            try:
+                with open(marker) as fh:
+                    return int(fh.readline().strip())
+            except (OSError, ValueError):
+                time.sleep(0.1)
+        return None
+
+    @staticmethod
+    def _find_chrome() -> Optional[str]:
+        env_path = os.environ.get("CHROME_PATH")
+        if env_path:
+            return env_path
+        for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"):
+            path = shutil.which(name)
+            if path:
+                return path
+        for path in (r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+                     r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+                     "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"):
+            if os.path.exists(path):
+                return path
+        return None
+
+    def close(self):
+        """Terminates the Chrome process and removes its profile."""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=3)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+        self.headless = None
+        self.debugger_address = None
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
 
 class ScraperWorker:
-    def __init__(self, keyword: str, headless: bool, callback: callable, ignore_urls: list = None):
+    # CSS attribute selector hits the browser's native fast path;
+    # the XPath contains() equivalent goes through the slower interpreter.
+    _PLACE_LINK_CSS = 'a[href*="/maps/place/"]'
+
+    # Candidate anchors for the main loop: the plain attribute selector is
+    # cheaper than attr-substring matching per element; the "/maps/place/"
+    # filter runs Python-side on the batched hrefs (str __contains__ uses
+    # CPython's SIMD-accelerated two-way search).
+    _ANCHOR_CSS = "a[href]"
+
+    # Count-only probe: returns one integer instead of marshalling a
+    # WebElement proxy per link on every poll tick.
+    _COUNT_JS = f'return document.querySelectorAll(\'{_PLACE_LINK_CSS}\').length;'
+
+    # Ad detection in-page: one round-trip, no forced-layout .text reads.
+    _IS_SPONSORED_JS = """
+        const el = arguments[0];
+        return el.closest('[aria-label*="Sponsored"]') !== null
+            || ((el.parentElement || el).textContent || '').includes('Sponsored');
+    """
+
+    # Gathers all detail fields in one in-page script call instead of a
+    # find_element round-trip per field. Mirrors the Selenium heuristics:
+    # active pane = last div[role=main] with a visible H1.
+    #
+    # Each field has an ordered strategy list. arguments[0] is a hint map
+    # {field: strategy index} of what matched last time — Maps renders the
+    # same layout variant for a whole run, so the winning strategy is tried
+    # first and the fallback ladder only runs on a miss. Returns
+    # {field: {v: value, s: matched strategy index}}.
+    _EXTRACT_JS = """
+        const hints = arguments[0] || {};
+        const mains = document.querySelectorAll("div[role='main']");
+        let ctx = null;
+        for (let i = mains.length - 1; i >= 0; i--) {
+            const h1 = mains[i].querySelector("h1");
+            if (h1 && h1.offsetParent !== null) { ctx = mains[i]; break; }
+        }
+        if (!ctx) ctx = mains.length ? mains[mains.length - 1] : document.body;
+
+        function byIcon(key) {
+            return (c) => {
+                for (const btn of c.querySelectorAll("button")) {
+                    const img = btn.querySelector("img");
+                    if (img && (img.src || "").includes(key)) {
+                        const div = btn.querySelector("div[class*='fontBodyMedium']");
+                        return (div || btn).textContent.trim();
+                    }
+                }
+                return null;
+            };
+        }
+        function byDataId(key) {
+            return (c) => {
+                const el = c.querySelector("button[data-item-id*='" + key + "']");
+                return el ? el.textContent.trim() : null;
+            };
+        }
+
+        const strategies = {
+            name: [(c) => {
+                for (const h1 of c.querySelectorAll("h1")) {
+                    const t = h1.textContent.trim();
+                    if (t && !t.includes("Result") && !t.includes("Showing")) return t;
+                }
+                return null;
+            }],
+            rating: [
+                (c) => {
+                    for (const el of c.querySelectorAll("div, span")) {
+                        if (el.childElementCount) continue;
+                        const t = el.textContent.trim();
+                        if (!/^\\d[.,]\\d$/.test(t)) continue;
+                        // Keep scanning on out-of-range leaves (e.g. a
+                        // "0,3" distance) like the Selenium heuristic
+                        const v = parseFloat(t.replace(',', '.'));
+                        if (v >= 1.0 && v <= 5.0) return t;
+                    }
+                    return null;
+                },
+                (c) => {
+                    for (const el of c.querySelectorAll("span[aria-label*='stars'], span[role='img']")) {
+                        const aria = el.getAttribute("aria-label") || "";
+                        const m = aria.match(/(\\d[.,]\\d) stars/) || aria.match(/Rated (\\d[.,]\\d)/);
+                        if (m) return m[1];
+                    }
+                    return null;
+                },
+            ],
+            website: [
+                (c) => {
+                    const a = c.querySelector("[data-item-id='authority']");
+                    if (!a) return null;
+                    return a.tagName === 'A' ? a.href : a.textContent.trim();
+                },
+                (c) => {
+                    for (const btn of c.querySelectorAll("button")) {
+                        const img = btn.querySelector("img");
+                        if (img && (img.src || "").includes("public_gm")) return btn.textContent.trim();
+                    }
+                    return null;
+                },
+            ],
+            address: [byIcon("place_gm"), byDataId("address")],
+            phone: [byIcon("phone_gm"), byDataId("phone")],
+        };
+
+        const out = {};
+        for (const field in strategies) {
+            const list = strategies[field];
+            const order = [];
+            const hint = hints[field];
+            if (list[hint]) order.push(hint);
+            for (let i = 0; i < list.length; i++) {
+                if (i !== order[0]) order.push(i);
+            }
+            let value = null, matched = null;
+            for (const i of order) {
+                value = list[i](ctx);
+                if (value) { matched = i; break; }
+            }
+            out[field] = {v: value, s: matched};
+        }
+        return out;
+    """
+
+    def __init__(self, keyword: str, headless: bool, callback: callable, ignore_urls: list = None,
+                 shot_interval: float = 0.5, chrome_session: Optional[ChromeSession] = None):
         self.keyword = keyword
         self.headless = headless
         self.callback = callback
-        self.ignore_urls: Set[str] = set(ignore_urls) if ignore_urls else set()
+        self.chrome_session = chrome_session
+        self._attached = False
+        # Min seconds between screenshot broadcasts (each capture is a
+        # 50-150 ms blocking CDP call producing a 100-300 KB frame)
+        self.shot_interval = shot_interval
+        self._last_shot = 0.0
+        # URLs are tracked as 64-bit hashes: place URLs run 200+ bytes and
+        # the set only ever answers "have I seen this".
+        self.ignore_urls: Set[int] = {_hash_url(u) for u in ignore_urls} if ignore_urls else set()
         
+        # Per-field strategy index that matched on the previous item;
+        # fed back into _EXTRACT_JS so the winning branch runs first.
+        self._hot_selectors: Dict[str, int] = {}
+
         self.is_running = False
+        self._stop_requested = False
         self._thread: Optional[threading.Thread] = None
+        self._future: Optional[asyncio.Future] = None
         self.driver: Optional[webdriver.Chrome] = None
-        self.processed_urls: Set[str] = self.ignore_urls.copy()
+        self.processed_urls: Set[int] = self.ignore_urls.copy()
 
     def start(self):
-        """Starts the scraping logic in a separate daemon thread."""
+        """
+        Starts the blocking scrape loop on the event loop's thread pool so
+        the loop can observe completion. Falls back to a plain daemon
+        thread when called outside a running loop (standalone use).
+        """
         if self.is_running:
             return
         self.is_running = True
-        self._thread = threading.Thread(target=self._run_logic, daemon=True)
-        self._thread.start()
+        try:
+            loop = asyncio.get_running_loop()
+            self._future = loop.run_in_executor(None, self._run_logic)
+        except RuntimeError:
+            self._thread = threading.Thread(target=self._run_logic, daemon=True)
+            self._thread.start()
 
     def stop(self):
-        """Signals the thread to stop and cleans up the driver."""
+        """
+        Signals the worker to stop and cleans up the driver. Terminal
+        callbacks are silenced from here on: the caller owns the UI state
+        and a late STOPPED/error from this worker would clobber a
+        successor's RUNNING status.
+        """
+        self._stop_requested = True
         self.is_running = False
+        if self._future:
+            self._future.cancel()  # No-op once running
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
         self._cleanup_driver()
 
+    async def wait_stopped(self, timeout: float = 2.0):
+        """Bounded wait for the scrape loop to actually exit after stop()."""
+        if self._future and not self._future.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(self._future), timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+
     def _cleanup_driver(self):
         if self.driver:
             try:
+                if self._attached:
+                    # Shared Chrome stays alive: drop our extra tabs and
+                    # park the remaining one. quit() only ends the session
+                    # since chromedriver didn't launch this browser.
+                    handles = self.driver.window_handles
+                    for handle in handles[1:]:
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                    self.driver.switch_to.window(handles[0])
+                    self.driver.get("about:blank")
                 self.driver.quit()
             except Exception:
                 pass
             self.driver = None
+            self._attached = False
 
     def _setup_driver(self):
-        """Initializes the Chrome WebDriver with robust options."""
+        """Attaches to the shared Chrome if available, else launches one."""
+        if self.chrome_session:
+            address = self.chrome_session.ensure(self.headless)
+            if address:
+                attach_opts = Options()
+                attach_opts.add_experimental_option("debuggerAddress", address)
+                try:
+                    self.driver = webdriver.Chrome(options=attach_opts)
+                    self._attached = True
+                    self.callback("log", "✅ Attached to running Chrome.")
+                    return
+                except Exception:
+                    self.callback("log", "⚠️ Attach failed, launching fresh Chrome...")
+
         opts = Options()
         if self.headless:
             opts.add_argument("--headless=new")
-        
-        # Stability arguments for various environments (Docker, Linux, etc.)
-        opts.add_argument("--no-sandbox")
-        opts.add_argument("--disable-dev-shm-usage")
-        opts.add_argument("--disable-blink-features=AutomationControlled")
-        opts.add_argument("--window-size=1280,800")
-        opts.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                          "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
+        for arg in _CHROME_ARGS:
+            opts.add_argument(arg)
+        opts.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+
         self.callback("log", "> [System] Launching Chrome Driver...")
         try:
-            service = ChromeService(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=opts)
+            driver_path = os.environ.get("CHROMEDRIVER_PATH")
+            if driver_path:
+                # Pinned binary for fully offline deploys
+                self.driver = webdriver.Chrome(service=ChromeService(driver_path), options=opts)
+            else:
+                # Selenium Manager resolves and caches the driver binary
+                self.driver = webdriver.Chrome(options=opts)
             self.callback("log", "✅ Driver initialized.")
         except Exception as e:
             self.callback("log", "❌ FATAL: Chrome Driver Failed.")
             raise e
 
     def _broadcast_view(self):
-        """Captures and sends a screenshot to the UI."""
+        """Captures and sends a screenshot to the UI (rate-limited)."""
         if self.driver and self.is_running:
+            now = time.monotonic()
+            if now - self._last_shot < self.shot_interval:
+                return
+            self._last_shot = now
             try:
-                b64_data = self.driver.get_screenshot_as_base64()
-                self.callback("image", b64_data)
+                # Raw PNG bytes; shipped as a binary frame (no base64 inflation)
+                png_bytes = self.driver.get_screenshot_as_png()
+                self.callback("image_bin", png_bytes)
             except Exception:
                 pass
 
@@ -109,8 +434,16 @@ class ScraperWorker:
         except Exception:
             return self.driver.find_element(By.TAG_NAME, "body")
 
-    def _extract_name(self) -> str:
-        """Polls for the place name (H1) to ensure the detail panel is fully loaded."""
+    def _extract_name(self) -> tuple:
+        """
+        Polls for the place name (H1), re-resolving the active pane on every
+        attempt: the detail pane is a NEW div[role='main'] appended after the
+        click, so a context captured before it renders pins the list view.
+
+        Returns (name, context) so callers can run the remaining extractors
+        against the pane that actually held the name.
+        """
+        context = None
         end_time = time.time() + 3.0
         while time.time() < end_time:
             try:
@@ -120,24 +453,24 @@ class ScraperWorker:
                     text = h1.text.strip()
                     # Filter out navigation headers like "Results for..."
                     if text and "Result" not in text and "Showing" not in text:
-                        return text
+                        return text, context
             except Exception:
                 pass
             time.sleep(0.15)
-        return "Unknown Name"
+        if context is None:
+            context = self._get_active_main_context()
+        return "Unknown Name", context
 
-    def _extract_rating(self) -> str:
+    def _extract_rating(self, context: WebElement) -> str:
         """Extracts rating using visual text first, then accessibility labels."""
         try:
-            context = self._get_active_main_context()
-            
             # Strategy 1: Visual Text (e.g., "4.7")
             # Strict regex to avoid matching integers like "5" (from "5 stars" filter)
             try:
                 elements = context.find_elements(By.XPATH, ".//div[string-length(text()) < 6] | .//span[string-length(text()) < 6]")
                 for el in elements:
                     text = el.text.strip()
-                    if re.match(r'^\d[\.,]\d$', text):
+                    if _RE_RATING.match(text):
                         val = float(text.replace(',', '.'))
                         if 1.0 <= val <= 5.0:
                             return text.replace(',', '.')
@@ -153,7 +486,7 @@ class ScraperWorker:
                         aria = el.get_attribute("aria-label")
                         if not aria: continue
                         # Match "4.7 stars" or "Rated 4.7"
-                        match = re.search(r'(\d[\.,]\d) stars', aria) or re.search(r'Rated (\d[\.,]\d)', aria)
+                        match = _RE_ARIA_STARS.search(aria) or _RE_RATED.search(aria)
                         if match:
                             return match.group(1).replace(',', '.')
                 except Exception:
@@ -162,6 +495,15 @@ class ScraperWorker:
             pass
         return "N/A"
 
+    @staticmethod
+    def _clean_rating(value) -> str:
+        """Validates a raw rating string (e.g. '4,7') and normalizes to '4.7'."""
+        if value and _RE_RATING.match(value.strip()):
+            text = value.strip().replace(',', '.')
+            if 1.0 <= float(text) <= 5.0:
+                return text
+        return "N/A"
+
     def _extract_link(self, clicked_href: str) -> str:
         """Prioritizes the clicked href, falls back to current URL if it's a place link."""
         if clicked_href and "/maps/place/" in clicked_href:
@@ -174,10 +516,9 @@ class ScraperWorker:
             pass
         return "N/A"
 
-    def _extract_website(self) -> str:
+    def _extract_website(self, context: WebElement) -> str:
         """Extracts website URL from authority buttons or links."""
         try:
-            context = self._get_active_main_context()
             # Try specific authority ID
             try:
                 el = context.find_element(By.CSS_SELECTOR, "[data-item-id='authority']")
@@ -200,10 +541,9 @@ class ScraperWorker:
             pass
         return "N/A"
 
-    def _extract_detail(self, icon_key: str, button_key: str = None) -> str:
+    def _extract_detail(self, context: WebElement, icon_key: str, button_key: str = None) -> str:
         """Generic extractor for fields like Phone/Address based on Icons or Data IDs."""
         try:
-            context = self._get_active_main_context()
             # Strategy 1: Icon
             try:
                 xpath = f".//button[descendant::img[contains(@src, '{icon_key}')]]//div[contains(@class, 'fontBodyMedium')]"
@@ -226,20 +566,24 @@ class ScraperWorker:
     # CORE LOGIC
     # =========================================================================
 
-    def _process_single_item(self, link_el: WebElement) -> None:
-        """Click, wait, scrape, and report a single item."""
+    def _process_single_item(self, link_el: WebElement, href: str, deadline: float) -> None:
+        """
+        Click, wait, scrape, and report a single item.
+
+        `deadline` (time.monotonic) is the earliest moment the next item may
+        start: the human-like throttle window, opened before extraction so
+        the Selenium round-trips run inside it instead of after it.
+        """
         try:
             # 1. Skip Ads/Sponsored
             try:
-                text_content = link_el.text + link_el.find_element(By.XPATH, "./..").text
-                if "Sponsored" in text_content:
+                if self.driver.execute_script(self._IS_SPONSORED_JS, link_el):
                     self.callback("log", "⚠️ Skipping Sponsored result")
                     return
             except Exception:
                 pass
 
             # 2. Click Item
-            href = link_el.get_attribute("href")
             self.driver.execute_script("arguments[0].scrollIntoView(true);", link_el)
             link_el.click()
 
@@ -251,21 +595,58 @@ class ScraperWorker:
 
             self._broadcast_view()
 
-            # 4. Extract Data
-            data = {
-                'name': self._extract_name(),
-                'rating': self._extract_rating(),
-                'link': self._extract_link(href),
-                'website': self._extract_website(),
-                'address': self._extract_detail("place_gm", "address"),
-                'phone': self._extract_detail("phone_gm", "phone")
-            }
+            # 4. Extract Data — one script call gathers all fields in-page,
+            # retried across the panel-load window like the baseline poll
+            # (the pane renders ~100-300 ms after the click; a single shot
+            # would miss and always fall back to the Selenium path)
+            raw = {}
+            fields = {}
+            end_time = time.time() + 3.0
+            while True:
+                try:
+                    raw = self.driver.execute_script(self._EXTRACT_JS, self._hot_selectors) or {}
+                except Exception:
+                    raw = {}
+                fields = {f: r.get('v') for f, r in raw.items() if isinstance(r, dict)}
+                if fields.get('name') or time.time() >= end_time:
+                    break
+                time.sleep(0.15)
+
+            if fields.get('name'):
+                # Cache winning strategies only for a loaded pane; matches
+                # against the list view would poison the hints
+                for field, result in raw.items():
+                    if isinstance(result, dict) and result.get('s') is not None:
+                        self._hot_selectors[field] = result['s']
+                data = {
+                    'name': fields['name'],
+                    'rating': self._clean_rating(fields.get('rating')),
+                    'link': self._extract_link(href),
+                    'website': (fields.get('website') or "").strip() or "N/A",
+                    'address': (fields.get('address') or "").strip() or "N/A",
+                    'phone': (fields.get('phone') or "").strip() or "N/A",
+                }
+            else:
+                # JS fast path missed (layout variant) — Selenium heuristics.
+                # The name poll re-resolves the pane until the place H1
+                # appears; reuse the pane it found for the other fields.
+                name, context = self._extract_name()
+                data = {
+                    'name': name,
+                    'rating': self._extract_rating(context),
+                    'link': self._extract_link(href),
+                    'website': self._extract_website(context),
+                    'address': self._extract_detail(context, "place_gm", "address"),
+                    'phone': self._extract_detail(context, "phone_gm", "phone")
+                }
 
             self.callback("row", data)
             self.callback("log", f"Extracted: {data['name']}")
-            
-            # Human-like delay
-            time.sleep(random.uniform(0.5, 1.0))
+
+            # Human-like delay: only whatever the scrape didn't already use
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
 
         except Exception as e:
             self.callback("log", f"⚠️ Error processing item: {str(e)[:50]}")
@@ -281,7 +662,7 @@ class ScraperWorker:
         # Wait for items to increase
         try:
             WebDriverWait(self.driver, 3).until(
-                lambda d: len(d.find_elements(By.XPATH, "//a[contains(@href, '/maps/place')]")) > current_count
+                lambda d: d.execute_script(self._COUNT_JS) > current_count
             )
         except Exception:
             time.sleep(1.5) # Hard wait if condition times out
@@ -313,19 +694,28 @@ class ScraperWorker:
             self._broadcast_view()
 
             while self.is_running:
-                # 1. Collect Links
-                all_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/maps/place')]")
-                
+                # 1. Collect candidate anchors
+                all_links = self.driver.find_elements(By.CSS_SELECTOR, self._ANCHOR_CSS)
+
+                # Batch-fetch hrefs in one script call (vs one CDP trip per link)
+                try:
+                    hrefs = self.driver.execute_script("return arguments[0].map(a => a.href);", all_links)
+                except Exception:
+                    hrefs = [l.get_attribute("href") for l in all_links]
+
                 # 2. Filter New Links (Resume Logic)
                 new_links = []
-                for l in all_links:
-                    href = l.get_attribute("href")
-                    if href and href not in self.processed_urls:
-                        new_links.append(l)
+                place_count = 0
+                for link_el, href in zip(all_links, hrefs):
+                    if not href or "/maps/place/" not in href:
+                        continue
+                    place_count += 1
+                    if _hash_url(href) not in self.processed_urls:
+                        new_links.append((link_el, href))
 
                 # 3. Decision: Scroll or Scrape
                 if not new_links:
-                    self._scroll_to_load(feed, len(all_links))
+                    self._scroll_to_load(feed, place_count)
                     scroll_fail_count += 1
                     if scroll_fail_count > 4:
                         self.callback("log", "> End of list reached or no new items found.")
@@ -336,19 +726,22 @@ class ScraperWorker:
                 scroll_fail_count = 0
                 
                 # 4. Process Batch
-                for link_el in new_links:
+                for link_el, href in new_links:
                     if not self.is_running: break
-                    
-                    href = link_el.get_attribute("href")
+
                     # Double check in case of duplicates in current batch
-                    if href in self.processed_urls: continue
-                    
-                    self.processed_urls.add(href)
-                    self._process_single_item(link_el)
+                    key = _hash_url(href)
+                    if key in self.processed_urls: continue
+
+                    self.processed_urls.add(key)
+                    deadline = time.monotonic() + random.uniform(0.5, 1.0)
+                    self._process_single_item(link_el, href, deadline)
 
         except Exception as e:
-            self.callback("log", f"❌ Worker Error: {str(e)}")
+            if not self._stop_requested:
+                self.callback("log", f"❌ Worker Error: {str(e)}")
         finally:
-            self.callback("status", "STOPPED")
-            self.callback("log", "🛑 Scraper Stopped.")
+            if not self._stop_requested:
+                self.callback("status", "STOPPED")
+                self.callback("log", "🛑 Scraper Stopped.")
             self._cleanup_driver()
\ No newline at end of file
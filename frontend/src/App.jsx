@@ -42,17 +42,37 @@ export default function App() {
 
     console.log("Connecting to:", targetUrl);
     const ws = new WebSocket(targetUrl);
+    // Server sends JSON as binary frames (orjson bytes)
+    ws.binaryType = "arraybuffer";
+    const decoder = new TextDecoder();
 
     ws.onopen = () => {
       addLog("> Connected to Scraper Engine.");
     };
 
     ws.onmessage = (event) => {
-      const msg = JSON.parse(event.data);
-      if (msg.type === "log") addLog(msg.payload);
-      if (msg.type === "row") addRow(msg.payload);
-      if (msg.type === "status") setStatus(msg.payload);
-      if (msg.type === "image") setLiveImage(msg.payload);
+      let raw = event.data;
+      if (raw instanceof ArrayBuffer) {
+        const bytes = new Uint8Array(raw);
+        // Tag byte 0x01 = raw PNG screenshot frame
+        if (bytes[0] === 1) {
+          const blob = new Blob([bytes.subarray(1)], { type: "image/png" });
+          setLiveImage(prev => {
+            if (prev) URL.revokeObjectURL(prev);
+            return URL.createObjectURL(blob);
+          });
+          return;
+        }
+        raw = decoder.decode(raw);
+      }
+      // Server batches bursts of events into a JSON array
+      const parsed = JSON.parse(raw);
+      const messages = Array.isArray(parsed) ? parsed : [parsed];
+      for (const msg of messages) {
+        if (msg.type === "log") addLog(msg.payload);
+        if (msg.type === "row") addRow(msg.payload);
+        if (msg.type === "status") setStatus(msg.payload);
+      }
     };
 
     ws.onclose = () => {
@@ -241,8 +261,8 @@ export default function App() {
                 // items-center: Căn giữa theo chiều dọc
                 <div className="flex items-center justify-center h-full w-full overflow-hidden bg-black/50 relative">
                     {liveImage ? (
-                        <img 
-                            src={`data:image/png;base64,${liveImage}`} 
+                        <img
+                            src={liveImage}
                             alt="Live View" 
                             className="max-w-none border border-[#4C566A] shadow-md transition-transform duration-200"
                             style={{ 
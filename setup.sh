@@ -1,4 +1,7 @@
 #!/bin/bash
 cd frontend && npm install && npm run build && cd ..
+# Pre-compress hashed assets; the backend serves .br/.gz when the client accepts them
+find frontend/dist/assets -type f \( -name '*.js' -o -name '*.css' \) -exec gzip -kf9 {} \;
+command -v brotli >/dev/null && find frontend/dist/assets -type f \( -name '*.js' -o -name '*.css' \) -exec brotli -f -q 11 {} \;
 cd backend && pip install -r requirements.txt 
 python main.py --host 0.0.0.0 --port 8000
\ No newline at end of file